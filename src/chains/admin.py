@@ -1,5 +1,6 @@
 from django.contrib import admin
-from django.db.models import Model
+from django.db.models import Model, QuerySet
+from django.http import HttpRequest
 
 from .models import Chain, Feature, GasPrice, Wallet
 
@@ -44,6 +45,9 @@ class GasPriceAdmin(admin.ModelAdmin[GasPrice]):
     search_fields = ("chain_id", "oracle_uri")
     ordering = ("rank",)
 
+    def get_queryset(self, request: HttpRequest) -> QuerySet[GasPrice]:
+        return super().get_queryset(request).select_related("chain")
+
 
 @admin.register(Wallet)
 class WalletAdmin(admin.ModelAdmin[Wallet]):
@@ -0,0 +1,19 @@
+# Generated by Django 3.2.9 on 2026-10-14 09:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chains", "0034_add_public_rpc_url"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chain",
+            index=models.Index(
+                fields=["relevance", "name"], name="chain_relevance_name_idx"
+            ),
+        ),
+    ]
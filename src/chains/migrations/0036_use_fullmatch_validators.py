@@ -0,0 +1,42 @@
+# Generated by Django 3.2.9 on 2026-10-14 10:05
+
+from django.db import migrations, models
+
+import chains.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chains", "0035_chain_relevance_name_idx"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="chain",
+            name="recommended_master_copy_version",
+            field=models.CharField(
+                max_length=255, validators=[chains.models.sem_ver_validator]
+            ),
+        ),
+        migrations.AlterField(
+            model_name="chain",
+            name="theme_background_color",
+            field=models.CharField(
+                default="#000000",
+                help_text="Please use the following format: <em>#RRGGBB</em>.",
+                max_length=9,
+                validators=[chains.models.color_validator],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="chain",
+            name="theme_text_color",
+            field=models.CharField(
+                default="#ffffff",
+                help_text="Please use the following format: <em>#RRGGBB</em>.",
+                max_length=9,
+                validators=[chains.models.color_validator],
+            ),
+        ),
+    ]
@@ -0,0 +1,107 @@
+# Generated by Django 3.2.9 on 2026-10-14 10:40
+from django.apps.registry import Apps
+from django.db import migrations, models
+from django.db.backends.base.schema import BaseDatabaseSchemaEditor
+from django.db.models import Case, Value, When
+
+RPC_AUTHENTICATION_FIELDS = [
+    "rpc_authentication",
+    "safe_apps_rpc_authentication",
+    "public_rpc_authentication",
+]
+
+# Previous (string) value -> new (integer) value
+RPC_AUTHENTICATION_MAPPING = {
+    "API_KEY_PATH": 1,
+    "NO_AUTHENTICATION": 2,
+}
+
+RPC_AUTHENTICATION_CHOICES = [(1, "Api Key Path"), (2, "No Authentication")]
+
+
+def copy_rpc_authentication(
+    apps: Apps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    Chain = apps.get_model("chains", "Chain")
+    db_alias = schema_editor.connection.alias
+    Chain.objects.using(db_alias).all().update(
+        **{
+            f"{field}_int": Case(
+                *[
+                    When(**{field: old_value}, then=new_value)
+                    for old_value, new_value in RPC_AUTHENTICATION_MAPPING.items()
+                ]
+            )
+            for field in RPC_AUTHENTICATION_FIELDS
+        }
+    )
+
+
+def restore_rpc_authentication(
+    apps: Apps, schema_editor: BaseDatabaseSchemaEditor
+) -> None:
+    # Runs once the string columns are added back and before the integer ones are dropped
+    Chain = apps.get_model("chains", "Chain")
+    db_alias = schema_editor.connection.alias
+    Chain.objects.using(db_alias).all().update(
+        **{
+            field: Case(
+                *[
+                    When(**{f"{field}_int": new_value}, then=Value(old_value))
+                    for old_value, new_value in RPC_AUTHENTICATION_MAPPING.items()
+                ]
+            )
+            for field in RPC_AUTHENTICATION_FIELDS
+        }
+    )
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("chains", "0036_use_fullmatch_validators"),
+    ]
+
+    operations = [
+        # Add the integer columns as nullable so they can be filled from the existing rows
+        *[
+            migrations.AddField(
+                model_name="chain",
+                name=f"{field}_int",
+                field=models.SmallIntegerField(
+                    choices=RPC_AUTHENTICATION_CHOICES, null=True
+                ),
+            )
+            for field in RPC_AUTHENTICATION_FIELDS
+        ],
+        migrations.RunPython(copy_rpc_authentication, restore_rpc_authentication),
+        # Replace the string columns with the integer ones
+        *[
+            migrations.RemoveField(model_name="chain", name=field)
+            for field in RPC_AUTHENTICATION_FIELDS
+        ],
+        *[
+            migrations.RenameField(
+                model_name="chain", old_name=f"{field}_int", new_name=field
+            )
+            for field in RPC_AUTHENTICATION_FIELDS
+        ],
+        migrations.AlterField(
+            model_name="chain",
+            name="rpc_authentication",
+            field=models.SmallIntegerField(choices=RPC_AUTHENTICATION_CHOICES),
+        ),
+        migrations.AlterField(
+            model_name="chain",
+            name="safe_apps_rpc_authentication",
+            field=models.SmallIntegerField(
+                choices=RPC_AUTHENTICATION_CHOICES, default=2
+            ),
+        ),
+        migrations.AlterField(
+            model_name="chain",
+            name="public_rpc_authentication",
+            field=models.SmallIntegerField(
+                choices=RPC_AUTHENTICATION_CHOICES, default=2
+            ),
+        ),
+    ]
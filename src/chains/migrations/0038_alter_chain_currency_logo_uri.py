@@ -0,0 +1,29 @@
+# Generated by Django 3.2.9 on 2026-10-14 12:20
+
+import django.core.validators
+from django.db import migrations, models
+
+import chains.models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chains", "0037_rpc_authentication_small_int"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="chain",
+            name="currency_logo_uri",
+            field=models.ImageField(
+                max_length=255,
+                upload_to=chains.models.native_currency_path,
+                validators=[
+                    django.core.validators.FileExtensionValidator(
+                        ["png", "jpg", "jpeg", "webp"]
+                    )
+                ],
+            ),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 3.2.9 on 2026-10-14 12:48
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chains", "0038_alter_chain_currency_logo_uri"),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name="gasprice",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    models.Q(
+                        ("fixed_wei_value__isnull", False),
+                        ("oracle_uri__isnull", True),
+                    ),
+                    models.Q(
+                        ("fixed_wei_value__isnull", True),
+                        ("oracle_uri__isnull", False),
+                    ),
+                    _connector="OR",
+                ),
+                name="gasprice_exactly_one_source",
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="gasprice",
+            constraint=models.CheckConstraint(
+                check=models.Q(
+                    ("oracle_uri__isnull", True),
+                    ("oracle_parameter__isnull", False),
+                    _connector="OR",
+                ),
+                name="gasprice_oracle_needs_parameter",
+            ),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 3.2.9 on 2026-10-14 13:15
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("chains", "0039_gasprice_constraints"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="chain",
+            index=models.Index(
+                django.db.models.functions.text.Upper("short_name"),
+                name="chain_short_name_upper_idx",
+            ),
+        ),
+    ]
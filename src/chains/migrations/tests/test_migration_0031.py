@@ -1,11 +1,25 @@
+import json
+from pathlib import Path
+
+from django.db.migrations.state import StateApps
+
 from .utils import TestMigrations
 
+CHAINS_FIXTURE = Path(__file__).parent / "fixtures" / "0030_chains.json"
+
 
 class Migration0029TestCase(TestMigrations):
     migrate_from = "0030_wallet"
     migrate_to = "0031_chain_block_explorer_uri_api_template"
 
-    fixtures = ["src/chains/migrations/tests/fixtures/0030_chains.json"]
+    def setUpBeforeMigration(self, apps: StateApps) -> None:
+        # The rows are created with the historical model: the fixture matches the
+        # schema at 0030_wallet and cannot be loaded with loaddata (current model)
+        Chain = apps.get_model("chains", "Chain")
+        with open(CHAINS_FIXTURE) as fixture:
+            for row in json.load(fixture):
+                if row["model"] == "chains.chain":
+                    Chain.objects.create(id=row["pk"], **row["fields"])
 
     def test_block_explorer_uri_api_template_is_set(self) -> None:
         Chain = self.apps_registry.get_model("chains", "Chain")
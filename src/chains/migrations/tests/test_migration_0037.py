@@ -0,0 +1,89 @@
+from django.db.migrations.state import StateApps
+
+from chains.migrations.tests.utils import TestMigrations
+
+
+class Migration0037TestCase(TestMigrations):
+    migrate_from = "0036_use_fullmatch_validators"
+    migrate_to = "0037_rpc_authentication_small_int"
+
+    def setUpBeforeMigration(self, apps: StateApps) -> None:
+        Chain = apps.get_model("chains", "Chain")
+        Chain.objects.create(
+            id=1,
+            name="Mainnet",
+            short_name="eth",
+            description="",
+            l2=False,
+            rpc_authentication="API_KEY_PATH",
+            rpc_uri="https://mainnet.infura.io/v3/",
+            safe_apps_rpc_authentication="NO_AUTHENTICATION",
+            safe_apps_rpc_uri="https://mainnet.infura.io/v3/",
+            public_rpc_authentication="API_KEY_PATH",
+            public_rpc_uri="https://mainnet.infura.io/v3/",
+            block_explorer_uri_address_template="https://etherscan.io/address/{{address}}",
+            block_explorer_uri_tx_hash_template="https://etherscan.io/tx/{{txHash}}",
+            block_explorer_uri_api_template="https://api.etherscan.io/api",
+            currency_name="Ether",
+            currency_symbol="ETH",
+            currency_decimals=18,
+            currency_logo_uri="https://gnosis-safe-token-logos.s3.amazonaws.com/ethereum-eth-logo.png",
+            transaction_service_uri="http://mainnet-safe-transaction-web.safe.svc.cluster.local",
+            vpc_transaction_service_uri="",
+            theme_text_color="#001428",
+            theme_background_color="#E8E7E6",
+            ens_registry_address="0x00000000000C2E074eC69A0dFb2997BA6C7d2e1e",
+            recommended_master_copy_version="1.3.0",
+        )
+
+    def test_rpc_authentication_converted(self) -> None:
+        Chain = self.apps_registry.get_model("chains", "Chain")
+
+        chain = Chain.objects.get(id=1)
+
+        self.assertEqual(chain.rpc_authentication, 1)
+        self.assertEqual(chain.safe_apps_rpc_authentication, 2)
+        self.assertEqual(chain.public_rpc_authentication, 1)
+
+
+class Migration0037ReverseTestCase(TestMigrations):
+    migrate_from = "0037_rpc_authentication_small_int"
+    migrate_to = "0036_use_fullmatch_validators"
+
+    def setUpBeforeMigration(self, apps: StateApps) -> None:
+        Chain = apps.get_model("chains", "Chain")
+        Chain.objects.create(
+            id=1,
+            name="Mainnet",
+            short_name="eth",
+            description="",
+            l2=False,
+            rpc_authentication=1,
+            rpc_uri="https://mainnet.infura.io/v3/",
+            safe_apps_rpc_authentication=2,
+            safe_apps_rpc_uri="https://mainnet.infura.io/v3/",
+            public_rpc_authentication=1,
+            public_rpc_uri="https://mainnet.infura.io/v3/",
+            block_explorer_uri_address_template="https://etherscan.io/address/{{address}}",
+            block_explorer_uri_tx_hash_template="https://etherscan.io/tx/{{txHash}}",
+            block_explorer_uri_api_template="https://api.etherscan.io/api",
+            currency_name="Ether",
+            currency_symbol="ETH",
+            currency_decimals=18,
+            currency_logo_uri="https://gnosis-safe-token-logos.s3.amazonaws.com/ethereum-eth-logo.png",
+            transaction_service_uri="http://mainnet-safe-transaction-web.safe.svc.cluster.local",
+            vpc_transaction_service_uri="",
+            theme_text_color="#001428",
+            theme_background_color="#E8E7E6",
+            ens_registry_address="0x00000000000C2E074eC69A0dFb2997BA6C7d2e1e",
+            recommended_master_copy_version="1.3.0",
+        )
+
+    def test_rpc_authentication_restored(self) -> None:
+        Chain = self.apps_registry.get_model("chains", "Chain")
+
+        chain = Chain.objects.get(id=1)
+
+        self.assertEqual(chain.rpc_authentication, "API_KEY_PATH")
+        self.assertEqual(chain.safe_apps_rpc_authentication, "NO_AUTHENTICATION")
+        self.assertEqual(chain.public_rpc_authentication, "API_KEY_PATH")
@@ -1,33 +1,45 @@
-import os
 import re
+from typing import Iterable
 
 from django.core.exceptions import ValidationError
-from django.core.validators import RegexValidator
+from django.core.validators import FileExtensionValidator
 from django.db import models
-from django.db.models import QuerySet
+from django.db.models import Q
+from django.db.models.functions import Upper
 from gnosis.eth.django.models import EthereumAddressField, Uint256Field
 
 HEX_ARGB_REGEX = re.compile("^#[0-9a-fA-F]{6}$")
 
-color_validator = RegexValidator(HEX_ARGB_REGEX, "Invalid hex color", "invalid")
+
+def color_validator(value: str) -> None:
+    if not HEX_ARGB_REGEX.fullmatch(value):
+        raise ValidationError("Invalid hex color", code="invalid")
+
 
 # https://semver.org/#is-there-a-suggested-regular-expression-regex-to-check-a-semver-string
 SEM_VER_REGEX = re.compile(
     r"^(0|[1-9]\d*)\.(0|[1-9]\d*)\.(0|[1-9]\d*)(?:-((?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*)(?:\.(?:0|[1-9]\d*|\d*[a-zA-Z-][0-9a-zA-Z-]*))*))?(?:\+([0-9a-zA-Z-]+(?:\.[0-9a-zA-Z-]+)*))?$"  # noqa E501
 )
 
-sem_ver_validator = RegexValidator(SEM_VER_REGEX, "Invalid version (semver)", "invalid")
+
+def sem_ver_validator(value: str) -> None:
+    if not SEM_VER_REGEX.fullmatch(value):
+        raise ValidationError("Invalid version (semver)", code="invalid")
+
+
+CURRENCY_LOGO_EXTENSIONS = ["png", "jpg", "jpeg", "webp"]
 
 
 def native_currency_path(instance: "Chain", filename: str) -> str:
-    _, file_extension = os.path.splitext(filename)  # file_extension includes the dot
+    _, dot, extension = filename.rpartition(".")
+    file_extension = f".{extension.lower()}" if dot else ""
     return f"chains/{instance.id}/currency_logo{file_extension}"
 
 
 class Chain(models.Model):
-    class RpcAuthentication(models.TextChoices):
-        API_KEY_PATH = "API_KEY_PATH"
-        NO_AUTHENTICATION = "NO_AUTHENTICATION"
+    class RpcAuthentication(models.IntegerChoices):
+        API_KEY_PATH = 1
+        NO_AUTHENTICATION = 2
 
     id = models.PositiveBigIntegerField(verbose_name="Chain Id", primary_key=True)
     relevance = models.SmallIntegerField(
@@ -39,18 +51,14 @@ class Chain(models.Model):
     )
     description = models.CharField(max_length=255, blank=True)
     l2 = models.BooleanField()
-    rpc_authentication = models.CharField(
-        max_length=255, choices=RpcAuthentication.choices
-    )
+    rpc_authentication = models.SmallIntegerField(choices=RpcAuthentication.choices)
     rpc_uri = models.URLField()
-    safe_apps_rpc_authentication = models.CharField(
-        max_length=255,
+    safe_apps_rpc_authentication = models.SmallIntegerField(
         choices=RpcAuthentication.choices,
         default=RpcAuthentication.NO_AUTHENTICATION,
     )
     safe_apps_rpc_uri = models.URLField(default="")
-    public_rpc_authentication = models.CharField(
-        max_length=255,
+    public_rpc_authentication = models.SmallIntegerField(
         choices=RpcAuthentication.choices,
         default=RpcAuthentication.NO_AUTHENTICATION,
     )
@@ -62,7 +70,9 @@ class Chain(models.Model):
     currency_symbol = models.CharField(max_length=255)
     currency_decimals = models.IntegerField(default=18)
     currency_logo_uri = models.ImageField(
-        upload_to=native_currency_path, max_length=255
+        upload_to=native_currency_path,
+        max_length=255,
+        validators=[FileExtensionValidator(CURRENCY_LOGO_EXTENSIONS)],
     )
     transaction_service_uri = models.URLField()
     vpc_transaction_service_uri = models.URLField()
@@ -84,11 +94,20 @@ class Chain(models.Model):
         max_length=255, validators=[sem_ver_validator]
     )
 
-    def get_disabled_wallets(self) -> QuerySet["Wallet"]:
-        all_wallets = Wallet.objects.all()
-        enabled_wallets = self.wallet_set.all()
-
-        return all_wallets.difference(enabled_wallets)
+    class Meta:
+        indexes = [
+            # Serves the default ordering of the chains list
+            models.Index(fields=["relevance", "name"], name="chain_relevance_name_idx"),
+            # Serves the case-insensitive short_name lookups (iexact uses UPPER on Postgres)
+            models.Index(Upper("short_name"), name="chain_short_name_upper_idx"),
+        ]
+
+    def get_disabled_wallet_keys(self, wallet_keys: Iterable[str]) -> list[str]:
+        # wallet_keys are the keys of all the wallets, in the order they are returned.
+        # They are passed in (and not queried here) so they can be shared by all the
+        # chains serialized in a request. wallet_set should be prefetched
+        enabled_wallet_keys = {wallet.key for wallet in self.wallet_set.all()}
+        return [key for key in wallet_keys if key not in enabled_wallet_keys]
 
     def __str__(self) -> str:
         return f"{self.name} | chain_id={self.id}"
@@ -112,8 +131,24 @@ class GasPrice(models.Model):
         default=100
     )  # A lower number will indicate higher ranking
 
+    class Meta:
+        # Same rules as clean() but also enforced for rows not saved through a form
+        constraints = [
+            models.CheckConstraint(
+                check=(
+                    Q(fixed_wei_value__isnull=False, oracle_uri__isnull=True)
+                    | Q(fixed_wei_value__isnull=True, oracle_uri__isnull=False)
+                ),
+                name="gasprice_exactly_one_source",
+            ),
+            models.CheckConstraint(
+                check=Q(oracle_uri__isnull=True) | Q(oracle_parameter__isnull=False),
+                name="gasprice_oracle_needs_parameter",
+            ),
+        ]
+
     def __str__(self) -> str:
-        return f"Chain = {self.chain.id} | uri={self.oracle_uri} | fixed_wei_value={self.fixed_wei_value}"
+        return f"Chain = {self.chain_id} | uri={self.oracle_uri} | fixed_wei_value={self.fixed_wei_value}"
 
     def clean(self) -> None:
         if (self.fixed_wei_value is not None) == (self.oracle_uri is not None):
@@ -60,7 +60,7 @@ class BaseRpcUriSerializer(serializers.Serializer[Chain]):
 
 class RpcUriSerializer(BaseRpcUriSerializer):
     def get_authentication(self, obj: Chain) -> str:
-        return obj.rpc_authentication
+        return Chain.RpcAuthentication(obj.rpc_authentication).name
 
     def get_rpc_value(self, obj: Chain) -> str:
         return obj.rpc_uri
@@ -68,7 +68,7 @@ class RpcUriSerializer(BaseRpcUriSerializer):
 
 class SafeAppsRpcUriSerializer(BaseRpcUriSerializer):
     def get_authentication(self, obj: Chain) -> str:
-        return obj.safe_apps_rpc_authentication
+        return Chain.RpcAuthentication(obj.safe_apps_rpc_authentication).name
 
     def get_rpc_value(self, obj: Chain) -> str:
         return obj.safe_apps_rpc_uri
@@ -76,7 +76,7 @@ class SafeAppsRpcUriSerializer(BaseRpcUriSerializer):
 
 class PublicRpcUriSerializer(BaseRpcUriSerializer):
     def get_authentication(self, obj: Chain) -> str:
-        return obj.public_rpc_authentication
+        return Chain.RpcAuthentication(obj.public_rpc_authentication).name
 
     def get_rpc_value(self, obj: Chain) -> str:
         return obj.public_rpc_uri
@@ -101,23 +101,25 @@ class WalletSerializer(serializers.Serializer[Wallet]):
 
 
 class ChainSerializer(serializers.ModelSerializer[Chain]):
+    # Nested serializers are declared as fields (instead of being instantiated in a
+    # SerializerMethodField) so they are bound once and reused for every serialized chain
     chain_id = serializers.CharField(source="id")
     chain_name = serializers.CharField(source="name")
     short_name = serializers.CharField()
-    rpc_uri = serializers.SerializerMethodField()
-    safe_apps_rpc_uri = serializers.SerializerMethodField()
-    public_rpc_uri = serializers.SerializerMethodField()
-    block_explorer_uri_template = serializers.SerializerMethodField()
+    rpc_uri = RpcUriSerializer(source="*")
+    safe_apps_rpc_uri = SafeAppsRpcUriSerializer(source="*")
+    public_rpc_uri = PublicRpcUriSerializer(source="*")
+    block_explorer_uri_template = BlockExplorerUriTemplateSerializer(source="*")
     native_currency = serializers.SerializerMethodField()
     transaction_service = serializers.URLField(
         source="transaction_service_uri", default=None
     )
     vpc_transaction_service = serializers.URLField(source="vpc_transaction_service_uri")
-    theme = serializers.SerializerMethodField()
-    gas_price = serializers.SerializerMethodField()
+    theme = ThemeSerializer(source="*")
+    gas_price = GasPriceSerializer(source="gasprice_set", many=True)
     ens_registry_address = EthereumAddressField()
     disabled_wallets = serializers.SerializerMethodField()
-    features = serializers.SerializerMethodField()
+    features = FeatureSerializer(source="feature_set", many=True)
 
     class Meta:
         model = Chain
@@ -142,47 +144,13 @@ class ChainSerializer(serializers.ModelSerializer[Chain]):
             "features",
         ]
 
+    # Serialized without the request context so the logo url is not made absolute
     @staticmethod
     @swagger_serializer_method(serializer_or_field=CurrencySerializer)  # type: ignore[misc]
     def get_native_currency(obj: Chain) -> ReturnDict:
         return CurrencySerializer(obj).data
 
-    @staticmethod
-    @swagger_serializer_method(serializer_or_field=ThemeSerializer)  # type: ignore[misc]
-    def get_theme(obj: Chain) -> ReturnDict:
-        return ThemeSerializer(obj).data
-
-    @staticmethod
-    @swagger_serializer_method(serializer_or_field=BaseRpcUriSerializer)  # type: ignore[misc]
-    def get_safe_apps_rpc_uri(obj: Chain) -> ReturnDict:
-        return SafeAppsRpcUriSerializer(obj).data
-
-    @staticmethod
-    @swagger_serializer_method(serializer_or_field=BaseRpcUriSerializer)  # type: ignore[misc]
-    def get_rpc_uri(obj: Chain) -> ReturnDict:
-        return RpcUriSerializer(obj).data
-
-    @staticmethod
-    @swagger_serializer_method(serializer_or_field=BaseRpcUriSerializer)  # type: ignore[misc]
-    def get_public_rpc_uri(obj: Chain) -> ReturnDict:
-        return PublicRpcUriSerializer(obj).data
-
-    @staticmethod
-    @swagger_serializer_method(serializer_or_field=BlockExplorerUriTemplateSerializer)  # type: ignore[misc]
-    def get_block_explorer_uri_template(obj: Chain) -> ReturnDict:
-        return BlockExplorerUriTemplateSerializer(obj).data
-
-    @swagger_serializer_method(serializer_or_field=GasPriceSerializer)  # type: ignore[misc]
-    def get_gas_price(self, instance) -> ReturnDict:  # type: ignore[no-untyped-def]
-        ranked_gas_prices = instance.gasprice_set.all().order_by("rank")
-        return GasPriceSerializer(ranked_gas_prices, many=True).data
-
     @swagger_serializer_method(serializer_or_field=WalletSerializer)  # type: ignore[misc]
-    def get_disabled_wallets(self, instance) -> ReturnDict:  # type: ignore[no-untyped-def]
-        disabled_wallets = instance.get_disabled_wallets().order_by("key")
-        return WalletSerializer(disabled_wallets, many=True).data
-
-    @swagger_serializer_method(serializer_or_field=FeatureSerializer)  # type: ignore[misc]
-    def get_features(self, instance) -> ReturnDict:  # type: ignore[no-untyped-def]
-        enabled_features = instance.feature_set.all().order_by("key")
-        return FeatureSerializer(enabled_features, many=True).data
+    def get_disabled_wallets(self, instance) -> list[str]:  # type: ignore[no-untyped-def]
+        # The wallet keys are provided by the views (see ChainsSerializerContextMixin)
+        return instance.get_disabled_wallet_keys(self.context["wallet_keys"])
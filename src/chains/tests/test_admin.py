@@ -0,0 +1,51 @@
+from django.contrib.admin import site
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+
+from ..admin import GasPriceAdmin
+from ..models import GasPrice
+from .factories import ChainFactory, GasPriceFactory
+
+
+class GasPriceAdminTest(TestCase):
+    request_factory = RequestFactory()
+
+    alfred: User
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        # Create superuser (alfred)
+        cls.alfred = User.objects.create_superuser(
+            "alfred", "alfred@example.com", "password"
+        )
+
+    def test_queryset_selects_chain(self) -> None:
+        GasPriceFactory.create_batch(3, chain=ChainFactory.create())
+        GasPriceFactory.create(chain=ChainFactory.create())
+        gas_price_admin = GasPriceAdmin(GasPrice, site)
+        request = self.request_factory.get("/")
+        request.user = self.alfred
+
+        queryset = gas_price_admin.get_queryset(request)
+
+        # The chains are fetched with the gas prices (single JOIN)
+        with self.assertNumQueries(1):
+            chains = [(str(gas_price), gas_price.chain.id) for gas_price in queryset]
+        self.assertEqual(len(chains), 4)
+
+    def test_changelist_queries_do_not_depend_on_rows(self) -> None:
+        url = reverse("admin:chains_gasprice_changelist")
+        self.client.force_login(self.alfred)
+        GasPriceFactory.create()
+        with CaptureQueriesContext(connection) as single_row_queries:
+            self.client.get(url)
+
+        GasPriceFactory.create_batch(4)
+        with CaptureQueriesContext(connection) as multiple_rows_queries:
+            response = self.client.get(url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(multiple_rows_queries), len(single_row_queries))
@@ -2,10 +2,11 @@ from decimal import Decimal
 
 import web3
 from django.core.exceptions import ValidationError
-from django.db import DataError
+from django.db import DataError, IntegrityError
 from django.test import TestCase, TransactionTestCase
 from faker import Faker
 
+from ..models import GasPrice
 from .factories import ChainFactory, FeatureFactory, GasPriceFactory, WalletFactory
 
 
@@ -17,6 +18,17 @@ class ChainTestCase(TestCase):
             f"{chain.name} | chain_id={chain.id}",
         )
 
+    def test_get_disabled_wallet_keys(self) -> None:
+        chain = ChainFactory.create()
+        WalletFactory.create(key="enabled", chains=(chain,))
+        WalletFactory.create(key="otherChain", chains=(ChainFactory.create(),))
+
+        disabled_wallet_keys = chain.get_disabled_wallet_keys(
+            ["zDisabled", "enabled", "otherChain", "aDisabled"]
+        )
+
+        self.assertEqual(disabled_wallet_keys, ["zDisabled", "otherChain", "aDisabled"])
+
 
 class GasPriceTestCase(TestCase):
     def test_str_method_output(self) -> None:
@@ -27,6 +39,12 @@ class GasPriceTestCase(TestCase):
             f"Chain = {gas_price.chain.id} | uri={gas_price.oracle_uri} | fixed_wei_value={gas_price.fixed_wei_value}",
         )
 
+    def test_str_method_does_not_query_chain(self) -> None:
+        gas_price = GasPrice.objects.get(pk=GasPriceFactory.create().pk)
+
+        with self.assertNumQueries(0):
+            str(gas_price)
+
 
 class ChainGasPriceFixedTestCase(TestCase):
     @staticmethod
@@ -39,7 +57,8 @@ class ChainGasPriceFixedTestCase(TestCase):
         gas_price.full_clean()
 
     def test_null_oracle_gas_oracle_with_null_fixed_gas_price(self) -> None:
-        gas_price = GasPriceFactory.create(
+        gas_price = GasPriceFactory.build(
+            chain=ChainFactory.create(),
             oracle_uri=None,
             fixed_wei_value=None,
         )
@@ -61,7 +80,8 @@ class ChainGasPriceOracleTestCase(TestCase):
     faker = Faker()
 
     def test_oracle_gas_parameter_with_null_uri(self) -> None:
-        gas_price = GasPriceFactory.create(
+        gas_price = GasPriceFactory.build(
+            chain=ChainFactory.create(),
             oracle_uri=None,
             oracle_parameter="fake parameter",
             fixed_wei_value=None,
@@ -71,7 +91,8 @@ class ChainGasPriceOracleTestCase(TestCase):
             gas_price.full_clean()
 
     def test_null_oracle_gas_parameter_with_uri(self) -> None:
-        gas_price = GasPriceFactory.create(
+        gas_price = GasPriceFactory.build(
+            chain=ChainFactory.create(),
             oracle_uri=self.faker.url(),
             oracle_parameter=None,
             fixed_wei_value=None,
@@ -91,6 +112,30 @@ class ChainGasPriceOracleTestCase(TestCase):
         gas_price.full_clean()
 
 
+class GasPriceConstraintsTestCase(TestCase):
+    faker = Faker()
+
+    def test_null_oracle_with_null_fixed_gas_price_not_stored(self) -> None:
+        with self.assertRaises(IntegrityError):
+            GasPriceFactory.create(oracle_uri=None, fixed_wei_value=None)
+
+    def test_oracle_with_fixed_gas_price_not_stored(self) -> None:
+        with self.assertRaises(IntegrityError):
+            GasPriceFactory.create(
+                oracle_uri=self.faker.url(),
+                oracle_parameter="fast",
+                fixed_wei_value=10000,
+            )
+
+    def test_oracle_with_null_parameter_not_stored(self) -> None:
+        with self.assertRaises(IntegrityError):
+            GasPriceFactory.create(
+                oracle_uri=self.faker.url(),
+                oracle_parameter=None,
+                fixed_wei_value=None,
+            )
+
+
 class ChainColorValidationTestCase(TransactionTestCase):
     faker = Faker()
 
@@ -106,6 +151,7 @@ class ChainColorValidationTestCase(TransactionTestCase):
             "#hhh",
             "#fff",
             "#ffffffff",
+            "#ffffff\n",
         ]
         for invalid_color in param_list:
             with self.subTest(msg=f"Invalid color {invalid_color} should throw"):
@@ -198,6 +244,7 @@ class ChainMinMasterCopyVersionValidationTestCase(TransactionTestCase):
             "1.1.01",
             "1.01.1",
             "01.1.1",
+            "1.2.3\n",
         ]
 
         for invalid_version in param_list:
@@ -236,6 +283,21 @@ class ChainCurrencyLogoTestCase(TestCase):
             chain.currency_logo_uri.url, "/media/chains/12/currency_logo.jpg"
         )
 
+    def test_currency_logo_upload_path_lowercase_extension(self) -> None:
+        chain = ChainFactory.create(
+            id=12, currency_logo_uri__filename="logo.example.PNG"
+        )
+
+        self.assertEqual(
+            chain.currency_logo_uri.url, "/media/chains/12/currency_logo.png"
+        )
+
+    def test_currency_logo_invalid_extension(self) -> None:
+        chain = ChainFactory.create(currency_logo_uri__filename="logo.gif")
+
+        with self.assertRaises(ValidationError):
+            chain.full_clean()
+
 
 class WalletTestCase(TestCase):
     def test_str_method_outputs_name(self) -> None:
@@ -3,8 +3,12 @@ from typing import Any
 
 from django.urls import reverse
 from faker import Faker
+from rest_framework.exceptions import APIException
+from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.test import APITestCase
 
+from ..models import Chain
+from ..serializers import GasPriceSerializer
 from .factories import ChainFactory, FeatureFactory, GasPriceFactory, WalletFactory
 
 
@@ -40,15 +44,21 @@ class ChainJsonPayloadFormatViewTests(APITestCase):
                     "description": chain.description,
                     "l2": chain.l2,
                     "rpcUri": {
-                        "authentication": chain.rpc_authentication,
+                        "authentication": Chain.RpcAuthentication(
+                            chain.rpc_authentication
+                        ).name,
                         "value": chain.rpc_uri,
                     },
                     "safeAppsRpcUri": {
-                        "authentication": chain.safe_apps_rpc_authentication,
+                        "authentication": Chain.RpcAuthentication(
+                            chain.safe_apps_rpc_authentication
+                        ).name,
                         "value": chain.safe_apps_rpc_uri,
                     },
                     "publicRpcUri": {
-                        "authentication": chain.public_rpc_authentication,
+                        "authentication": Chain.RpcAuthentication(
+                            chain.public_rpc_authentication
+                        ).name,
                         "value": chain.public_rpc_uri,
                     },
                     "blockExplorerUriTemplate": {
@@ -142,6 +152,93 @@ class ChainPaginationViewTests(APITestCase):
         # returned items should still be zero
         self.assertEqual(len(response.json()["results"]), 0)
 
+    def test_shared_pagination_class_is_not_modified(self) -> None:
+        self.assertIsNone(LimitOffsetPagination.max_limit)
+        self.assertIsNone(LimitOffsetPagination.default_limit)
+
+
+class ChainsListViewQueriesTests(APITestCase):
+    def test_related_objects_are_prefetched(self) -> None:
+        chain_1 = ChainFactory.create(id=1)
+        chain_2 = ChainFactory.create(id=2)
+        chain_3 = ChainFactory.create(id=3)
+        for chain in (chain_1, chain_2, chain_3):
+            GasPriceFactory.create_batch(2, chain=chain)
+            FeatureFactory.create(chains=(chain,))
+        WalletFactory.create(key="walletA", chains=(chain_1,))
+        WalletFactory.create(key="walletB", chains=(chain_1, chain_2))
+        WalletFactory.create(key="walletC", chains=())
+        url = reverse("v1:chains:list")
+
+        # count + chains + gas prices + features + enabled wallets (prefetched)
+        # + all wallet keys (once for the whole page)
+        with self.assertNumQueries(6):
+            response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        disabled_wallets = {
+            result["chainId"]: result["disabledWallets"]
+            for result in response.json()["results"]
+        }
+        self.assertEqual(
+            disabled_wallets,
+            {
+                "1": ["walletC"],
+                "2": ["walletA", "walletC"],
+                "3": ["walletA", "walletB", "walletC"],
+            },
+        )
+
+
+class ChainsListViewConditionalGetTests(APITestCase):
+    def test_should_not_cache_response(self) -> None:
+        ChainFactory.create()
+        url = reverse("v1:chains:list")
+
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.headers.get("Cache-Control"))
+        self.assertIsNotNone(response.headers.get("ETag"))
+
+    def test_matching_etag_returns_not_modified(self) -> None:
+        ChainFactory.create()
+        url = reverse("v1:chains:list")
+        etag = self.client.get(path=url, data=None, format="json").headers["ETag"]
+
+        response = self.client.get(
+            path=url, data=None, format="json", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_changes_on_chain_update(self) -> None:
+        ChainFactory.create()
+        url = reverse("v1:chains:list")
+        etag = self.client.get(path=url, data=None, format="json").headers["ETag"]
+
+        ChainFactory.create()
+        response = self.client.get(
+            path=url, data=None, format="json", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_wallet_chains_update_is_reflected(self) -> None:
+        chain = ChainFactory.create()
+        wallet = WalletFactory.create(chains=())
+        url = reverse("v1:chains:list")
+        response = self.client.get(path=url, data=None, format="json")
+        self.assertEqual(response.json()["results"][0]["disabledWallets"], [wallet.key])
+
+        wallet.chains.add(chain)
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"][0]["disabledWallets"], [])
+
 
 class ChainDetailViewTests(APITestCase):
     def test_json_payload_format(self) -> None:
@@ -155,15 +252,21 @@ class ChainDetailViewTests(APITestCase):
             "description": chain.description,
             "l2": chain.l2,
             "rpcUri": {
-                "authentication": chain.rpc_authentication,
+                "authentication": Chain.RpcAuthentication(
+                    chain.rpc_authentication
+                ).name,
                 "value": chain.rpc_uri,
             },
             "safeAppsRpcUri": {
-                "authentication": chain.safe_apps_rpc_authentication,
+                "authentication": Chain.RpcAuthentication(
+                    chain.safe_apps_rpc_authentication
+                ).name,
                 "value": chain.safe_apps_rpc_uri,
             },
             "publicRpcUri": {
-                "authentication": chain.public_rpc_authentication,
+                "authentication": Chain.RpcAuthentication(
+                    chain.public_rpc_authentication
+                ).name,
                 "value": chain.public_rpc_uri,
             },
             "blockExplorerUriTemplate": {
@@ -200,6 +303,26 @@ class ChainDetailViewTests(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), json_response)
 
+    def test_rpc_authentication_serialized_by_name(self) -> None:
+        ChainFactory.create(
+            id=1,
+            rpc_authentication=Chain.RpcAuthentication.API_KEY_PATH,
+            safe_apps_rpc_authentication=Chain.RpcAuthentication.NO_AUTHENTICATION,
+            public_rpc_authentication=Chain.RpcAuthentication.NO_AUTHENTICATION,
+        )
+        url = reverse("v1:chains:detail", args=[1])
+
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["rpcUri"]["authentication"], "API_KEY_PATH")
+        self.assertEqual(
+            response.json()["safeAppsRpcUri"]["authentication"], "NO_AUTHENTICATION"
+        )
+        self.assertEqual(
+            response.json()["publicRpcUri"]["authentication"], "NO_AUTHENTICATION"
+        )
+
     def test_no_match(self) -> None:
         ChainFactory.create(id=1)
         url = reverse("v1:chains:detail", args=[2])
@@ -223,6 +346,45 @@ class ChainDetailViewTests(APITestCase):
         self.assertEqual(response_by_id.json(), response_by_short_name.json())
 
 
+class ChainDetailViewByShortNameTests(APITestCase):
+    def test_case_insensitive_match(self) -> None:
+        ChainFactory.create(id=1, short_name="eth")
+        url = reverse("v1:chains:detail_by_short_name", args=["ETH"])
+
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["chainId"], "1")
+
+    def test_exact_match_takes_precedence(self) -> None:
+        ChainFactory.create(id=1, short_name="eth")
+        ChainFactory.create(id=2, short_name="ETH")
+        url = reverse("v1:chains:detail_by_short_name", args=["ETH"])
+
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["chainId"], "2")
+
+    def test_lowest_chain_id_returned_on_case_insensitive_matches(self) -> None:
+        ChainFactory.create(id=2, short_name="Eth")
+        ChainFactory.create(id=1, short_name="eth")
+        url = reverse("v1:chains:detail_by_short_name", args=["ETH"])
+
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["chainId"], "1")
+
+    def test_no_match(self) -> None:
+        ChainFactory.create(id=1, short_name="eth")
+        url = reverse("v1:chains:detail_by_short_name", args=["gor"])
+
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 404)
+
+
 class ChainsListViewRelevanceTests(APITestCase):
     def test_relevance_sorting(self) -> None:
         chain_1 = ChainFactory.create(name="aaa", relevance=10)
@@ -319,7 +481,10 @@ class ChainGasPriceTests(APITestCase):
     def test_oracle_json_payload_format(self) -> None:
         chain = ChainFactory.create(id=1)
         gas_price = GasPriceFactory.create(
-            chain=chain, oracle_uri=self.faker.url(), fixed_wei_value=None
+            chain=chain,
+            oracle_uri=self.faker.url(),
+            oracle_parameter="fast",
+            fixed_wei_value=None,
         )
         url = reverse("v1:chains:detail", args=[1])
         expected_oracle_json_payload = [
@@ -356,20 +521,18 @@ class ChainGasPriceTests(APITestCase):
 
     def test_oracle_with_fixed(self) -> None:
         chain = ChainFactory.create(id=1)
-        GasPriceFactory.create(
+        # Such a gas price cannot be stored (see GasPrice constraints)
+        gas_price = GasPriceFactory.build(
             chain=chain,
             oracle_uri=self.faker.url(),
             fixed_wei_value=self.faker.pyint(),
         )
-        url = reverse("v1:chains:detail", args=[1])
-        expected_error_body = {
-            "detail": f"The gas price oracle or a fixed gas price was not provided for chain {chain}"
-        }
-
-        response = self.client.get(path=url, data=None, format="json")
 
-        self.assertEqual(response.status_code, 500)
-        self.assertEqual(response.json(), expected_error_body)
+        with self.assertRaisesMessage(
+            APIException,
+            f"The gas price oracle or a fixed gas price was not provided for chain {chain}",
+        ):
+            GasPriceSerializer(gas_price).data
 
     def test_fixed_gas_256_bit(self) -> None:
         chain = ChainFactory.create(id=1)
@@ -1,22 +1,49 @@
 from typing import Any
 
+from django.db.models import Prefetch
+from django.http import Http404
+from django.middleware.http import ConditionalGetMiddleware
+from django.utils.decorators import decorator_from_middleware, method_decorator
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework import filters
-from rest_framework.generics import ListAPIView, RetrieveAPIView
+from rest_framework.generics import GenericAPIView, ListAPIView, RetrieveAPIView
 from rest_framework.pagination import LimitOffsetPagination
 from rest_framework.request import Request
 from rest_framework.response import Response
 
-from .models import Chain
+from .models import Chain, Feature, GasPrice, Wallet
 from .serializers import ChainSerializer
 
+# Reverse relations walked by ChainSerializer are fetched once per queryset
+# (instead of once per chain) already in the order they are serialized
+CHAINS_QUERYSET = Chain.objects.prefetch_related(
+    Prefetch("gasprice_set", queryset=GasPrice.objects.order_by("rank")),
+    Prefetch("feature_set", queryset=Feature.objects.order_by("key")),
+    "wallet_set",
+)
 
-class ChainsListView(ListAPIView):
+
+class ChainsSerializerContextMixin(GenericAPIView):
+    def get_serializer_context(self) -> dict[str, Any]:
+        context = super().get_serializer_context()
+        # ChainSerializer computes the disabled wallets of each chain from all the wallet
+        # keys. The queryset is lazy and keeps its results once iterated so it is queried
+        # at most once per request, however many chains are serialized
+        context["wallet_keys"] = Wallet.objects.order_by("key").values_list(
+            "key", flat=True
+        )
+        return context
+
+
+class ChainsPagination(LimitOffsetPagination):
+    default_limit = 10
+    max_limit = 100
+
+
+class ChainsListView(ChainsSerializerContextMixin, ListAPIView):
     serializer_class = ChainSerializer
-    pagination_class = LimitOffsetPagination
-    pagination_class.max_limit = 100
-    pagination_class.default_limit = 10
-    queryset = Chain.objects.all()
+    pagination_class = ChainsPagination
+    queryset = CHAINS_QUERYSET
     filter_backends = [filters.OrderingFilter]
     ordering_fields = ["relevance", "name"]
     ordering = [
@@ -24,10 +51,17 @@ class ChainsListView(ListAPIView):
         "name",
     ]
 
+    # The response is not cached server-side: the CGW flush webhook expects the
+    # next fetch to be fresh. The ETag computed from the response body still
+    # lets clients with an up-to-date copy skip the payload download (304)
+    @method_decorator(decorator_from_middleware(ConditionalGetMiddleware))
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return super().get(request, *args, **kwargs)
+
 
-class ChainsDetailView(RetrieveAPIView):
+class ChainsDetailView(ChainsSerializerContextMixin, RetrieveAPIView):
     serializer_class = ChainSerializer
-    queryset = Chain.objects.all()
+    queryset = CHAINS_QUERYSET
 
     @swagger_auto_schema(
         operation_id="Get chain by id"
@@ -36,10 +70,28 @@ class ChainsDetailView(RetrieveAPIView):
         return super().get(request, *args, **kwargs)
 
 
-class ChainsDetailViewByShortName(RetrieveAPIView):
+class ChainsDetailViewByShortName(ChainsSerializerContextMixin, RetrieveAPIView):
     lookup_field = "short_name"
     serializer_class = ChainSerializer
-    queryset = Chain.objects.all()
+    queryset = CHAINS_QUERYSET
+
+    def get_object(self) -> Chain:
+        queryset = self.filter_queryset(self.get_queryset())
+        short_name = self.kwargs[self.lookup_field]
+
+        # Ordered so the same chain is returned when only case-insensitive matches exist
+        chains: list[Chain] = list(
+            queryset.filter(short_name__iexact=short_name).order_by("id")
+        )
+        if not chains:
+            raise Http404
+        # short_name is only unique case-sensitively so an exact match takes precedence
+        chain = next(
+            (chain for chain in chains if chain.short_name == short_name), chains[0]
+        )
+
+        self.check_object_permissions(self.request, chain)
+        return chain
 
     @swagger_auto_schema(
         operation_id="Get chain by shortName",
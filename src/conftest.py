@@ -2,6 +2,7 @@ import shutil
 import tempfile
 
 import pytest
+from django.core.cache import caches
 
 
 @pytest.fixture(autouse=True)
@@ -18,3 +19,12 @@ def use_tmp_media_root(settings):
 
     # After running each test remove the tmp directory
     shutil.rmtree(settings.MEDIA_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    yield  # run test
+
+    # Responses cached by a test should not leak into the next one
+    for cache in caches.all():
+        cache.clear()
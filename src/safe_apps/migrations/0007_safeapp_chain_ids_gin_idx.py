@@ -0,0 +1,20 @@
+# Generated by Django 3.2.9 on 2026-10-14 09:31
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("safe_apps", "0006_safeapp_chain_ids_big_int"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="safeapp",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["chain_ids"], name="safe_app_chain_ids_idx"
+            ),
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.indexes import GinIndex
 from django.db import models
 
 
@@ -24,5 +25,11 @@ class SafeApp(models.Model):
         Provider, null=True, blank=True, on_delete=models.SET_NULL
     )
 
+    class Meta:
+        indexes = [
+            # Serves the chain_ids containment lookups (ie.: filtering by chain id)
+            GinIndex(fields=["chain_ids"], name="safe_app_chain_ids_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.name} | {self.url} | chain_ids={self.chain_ids}"
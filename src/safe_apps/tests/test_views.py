@@ -157,6 +157,25 @@ class FilterSafeAppListViewTests(APITestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json(), json_response)
 
+    def test_no_apps_returned_on_overflowing_chain_id(self) -> None:
+        SafeAppFactory.create_batch(3, chain_ids=[1])
+        json_response: List[Dict[str, Any]] = []
+        url = reverse("v1:safe-apps:list") + f"?chainId={2**64}"
+
+        response = self.client.get(path=url, data=None, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), json_response)
+
+    def test_all_apps_returned_on_non_decimal_chain_id(self) -> None:
+        SafeAppFactory.create_batch(3, chain_ids=[1])
+        url = reverse("v1:safe-apps:list")
+
+        response = self.client.get(path=url, data={"chainId": "²"}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 3)
+
     def test_apps_returned_on_same_key_pair(self) -> None:
         safe_app_1 = SafeAppFactory.create(chain_ids=[1])
         SafeAppFactory.create(chain_ids=[2])
@@ -246,10 +265,64 @@ class CacheSafeAppTests(APITestCase):
         cache_control = response.headers.get("Cache-Control")
 
         self.assertEqual(response.status_code, 200)
-        # Cache-Control should be 10 minutes (60 * 10)
-        self.assertEqual(cache_control, "max-age=600")
+        # Clients should revalidate (with the ETag) before using a stored response
+        self.assertEqual(cache_control, "no-cache")
         self.assertEqual(response.json(), json_response)
 
+    def test_unrelated_query_params_share_cache_entry(self) -> None:
+        SafeAppFactory.create(chain_ids=[1])
+        url = reverse("v1:safe-apps:list")
+
+        self.client.get(path=url, data={"chainId": "1"}, format="json")
+        # Served from the cache: no database queries
+        with self.assertNumQueries(0):
+            response = self.client.get(
+                path=url, data={"chainId": "01", "foo": "bar"}, format="json"
+            )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_matching_etag_returns_not_modified(self) -> None:
+        SafeAppFactory.create(chain_ids=[1])
+        url = reverse("v1:safe-apps:list")
+        response = self.client.get(path=url, data={"chainId": "1"}, format="json")
+        etag = response.headers["ETag"]
+
+        response = self.client.get(
+            path=url, data={"chainId": "1"}, format="json", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+
+    def test_etag_changes_on_safe_app_update(self) -> None:
+        safe_app = SafeAppFactory.create(chain_ids=[1])
+        url = reverse("v1:safe-apps:list")
+        response = self.client.get(path=url, data={"chainId": "1"}, format="json")
+        etag = response.headers["ETag"]
+
+        safe_app.name = "New name"
+        safe_app.save()
+        response = self.client.get(
+            path=url, data={"chainId": "1"}, format="json", HTTP_IF_NONE_MATCH=etag
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()[0]["name"], "New name")
+
+    def test_safe_app_update_clears_cache(self) -> None:
+        safe_app = SafeAppFactory.create(chain_ids=[1])
+        url = reverse("v1:safe-apps:list")
+        self.client.get(path=url, data={"chainId": "1"}, format="json")
+
+        safe_app.visible = False
+        safe_app.save()
+        response = self.client.get(path=url, data={"chainId": "1"}, format="json")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), [])
+
 
 class SafeAppsVisibilityTests(APITestCase):
     def test_visible_safe_app_is_shown(self) -> None:
@@ -1,8 +1,10 @@
-from typing import Any
+from typing import Any, Optional
 
+from django.core.cache import caches
 from django.db.models import QuerySet
-from django.utils.decorators import method_decorator
-from django.views.decorators.cache import cache_page
+from django.middleware.http import ConditionalGetMiddleware
+from django.utils.decorators import decorator_from_middleware, method_decorator
+from django.views.decorators.cache import cache_control
 from drf_yasg import openapi
 from drf_yasg.utils import swagger_auto_schema
 from rest_framework.generics import ListAPIView
@@ -12,6 +14,10 @@ from rest_framework.response import Response
 from .models import SafeApp
 from .serializers import SafeAppsResponseSerializer
 
+CACHE_TIMEOUT = 60 * 10  # 10 minutes
+# chain_ids items are stored as a (signed) bigint
+MAX_CHAIN_ID = 2**63 - 1
+
 
 class SafeAppsListView(ListAPIView):
     serializer_class = SafeAppsResponseSerializer
@@ -24,7 +30,11 @@ class SafeAppsListView(ListAPIView):
         type=openapi.TYPE_INTEGER,
     )
 
-    @method_decorator(cache_page(60 * 10, cache="safe-apps"))  # Cache 10 minutes
+    # Clients must revalidate on every use (no-cache). The ETag is computed from the
+    # response body so clients with an up-to-date copy get a 304 without the payload
+    # being transmitted again
+    @method_decorator(decorator_from_middleware(ConditionalGetMiddleware))
+    @method_decorator(cache_control(no_cache=True))
     @swagger_auto_schema(manual_parameters=[_swagger_network_id_param])  # type: ignore[misc]
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """
@@ -33,11 +43,35 @@ class SafeAppsListView(ListAPIView):
         """
         return super().get(request, *args, **kwargs)
 
+    def list(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        # The serialized Safe Apps are cached per chain id (and not per url) so query params
+        # which do not affect the result share the same entry.
+        # The cache is cleared whenever a SafeApp or Provider changes (see signals.py)
+        cache = caches["safe-apps"]
+        cache_key = f"safe_apps:{self._get_network_id()}"
+
+        data = cache.get(cache_key)
+        if data is None:
+            data = super().list(request, *args, **kwargs).data
+            cache.set(cache_key, data, CACHE_TIMEOUT)
+
+        return Response(data)
+
     def get_queryset(self) -> QuerySet[SafeApp]:
         queryset = SafeApp.objects.filter(visible=True)
 
-        network_id = self.request.query_params.get("chainId")
-        if network_id is not None and network_id.isdigit():
-            queryset = queryset.filter(chain_ids__contains=[network_id])
+        network_id = self._get_network_id()
+        if network_id is not None:
+            if network_id > MAX_CHAIN_ID:
+                # Cannot be stored in chain_ids so no Safe App can match it
+                return queryset.none()
+            queryset = queryset.filter(chain_ids__overlap=[network_id])
 
         return queryset
+
+    def _get_network_id(self) -> Optional[int]:
+        network_id = self.request.query_params.get("chainId")
+        # isdecimal (unlike isdigit) only accepts characters supported by int()
+        if network_id is not None and network_id.isdecimal():
+            return int(network_id)
+        return None